@@ -167,9 +167,10 @@ if CLOUDINARY_CLOUD_NAME and CLOUDINARY_API_KEY and CLOUDINARY_API_SECRET:
 # Separar STATIC files (CSS/JS) de MEDIA files (uploads de usuarios)
 if CLOUDINARY_CLOUD_NAME and CLOUDINARY_API_KEY and CLOUDINARY_API_SECRET:
     # Producción (Railway): WhiteNoise para static, Cloudinary para media
+    # (los archivos grandes, como el PDF combinado, se suben por fragmentos)
     STORAGES = {
         "default": {
-            "BACKEND": "cloudinary_storage.storage.MediaCloudinaryStorage",
+            "BACKEND": "separador_recibos.storage_backends.MediaCloudinaryStorageFragmentado",
         },
         "staticfiles": {
             "BACKEND": "whitenoise.storage.CompressedStaticFilesStorage",
@@ -205,6 +206,45 @@ LOGOUT_REDIRECT_URL = '/login/'
 
 # Configuración adicional para Separador de Recibos PDF
 
+# Procesos para detectar recibos en paralelo (1 = detección en serie)
+# En Railway con 4 núcleos: SEPARADOR_DETECCION_WORKERS=4
+SEPARADOR_DETECCION_WORKERS = config('SEPARADOR_DETECCION_WORKERS', default=1, cast=int)
+
+# Procesos para extraer imágenes de recibos en paralelo (1 = extracción en serie)
+SEPARADOR_IMAGENES_WORKERS = config('SEPARADOR_IMAGENES_WORKERS', default=1, cast=int)
+
+# Codificación de las imágenes en calidad 'alta' (sin pérdida): 'auto' elige según el
+# contenido (PNG 1 bit / grises / paleta, WebP sin pérdida para color) o un perfil fijo
+# de separador_recibos/utils/image_encoding.py (p. ej. 'png_rapido', 'png_max')
+SEPARADOR_PERFIL_IMAGEN = config('SEPARADOR_PERFIL_IMAGEN', default='auto')
+
+# Formato de salida preseleccionado en el formulario de carga (el usuario puede
+# cambiarlo): 'pdf_imagenes', 'pdf_texto', 'ambos' o 'pdf_vectorial' (recorta las
+# páginas originales sin rasterizar: mucho más rápido, archivos livianos y texto seleccionable)
+SEPARADOR_FORMATO_SALIDA = config('SEPARADOR_FORMATO_SALIDA', default='pdf_imagenes')
+
+# Recortar cada imagen a su contenido: quita los márgenes en blanco del rectángulo
+# detectado y el separador / encabezado del recibo siguiente que a veces queda al pie
+SEPARADOR_RECORTE_CONTENIDO = config('SEPARADOR_RECORTE_CONTENIDO', default=True, cast=bool)
+
+# Caché en disco de imágenes de recibos por contenido (SHA-256 del PDF + recorte + codificación):
+# resubir el mismo extracto no vuelve a rasterizarlo. Tamaño máximo en MB (0 = deshabilitada)
+# y directorio (vacío = directorio temporal del sistema)
+SEPARADOR_CACHE_RENDER_MAX_MB = config('SEPARADOR_CACHE_RENDER_MAX_MB', default=512, cast=int)
+SEPARADOR_CACHE_RENDER_DIR = config('SEPARADOR_CACHE_RENDER_DIR', default='')
+
+# Subidas simultáneas al storage (Cloudinary) por procesamiento y reintentos por archivo
+SEPARADOR_SUBIDA_WORKERS = config('SEPARADOR_SUBIDA_WORKERS', default=4, cast=int)
+SEPARADOR_SUBIDA_REINTENTOS = config('SEPARADOR_SUBIDA_REINTENTOS', default=3, cast=int)
+
+# Cola de procesamiento en base de datos (worker: python manage.py procesar_cola)
+# Procesos que inicia cada worker, trabajos simultáneos en total, segundos sin
+# renovar antes de reencolar un trabajo en curso e intentos antes de darlo por fallido
+SEPARADOR_COLA_PROCESOS = config('SEPARADOR_COLA_PROCESOS', default=1, cast=int)
+SEPARADOR_COLA_CONCURRENCIA = config('SEPARADOR_COLA_CONCURRENCIA', default=2, cast=int)
+SEPARADOR_COLA_VISIBILIDAD = config('SEPARADOR_COLA_VISIBILIDAD', default=300, cast=int)
+SEPARADOR_COLA_MAX_INTENTOS = config('SEPARADOR_COLA_MAX_INTENTOS', default=3, cast=int)
+
 # Celery Configuration (OPCIONAL - Solo si usas Celery)
 # Para usar Celery, primero instalar y ejecutar Redis: redis-server
 CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')